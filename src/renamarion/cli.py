@@ -1,21 +1,35 @@
-import time
+import os
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
+from collections import defaultdict, deque
 import click
 from colorama import Fore, Style
-from typing import Literal, Set, Any, Dict, Type
+from typing import Literal, NamedTuple, Set, Any, Dict, Type
 from abc import ABC, abstractmethod
 
 
 class MatcherAction(ABC):
-    @abstractmethod
-    def matches(self, item_name: str) -> bool: ...
+    pattern: str
+    suffixes: tuple[str, ...] = ()
 
     @classmethod
     @abstractmethod
     def replace(cls, item_name: str) -> str: ...
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not isinstance(getattr(cls, "pattern", None), str):
+            raise TypeError(f"{cls.__name__} must define a pattern string")
+
     def __init__(self, name: str):
+        if name not in re.compile(self.pattern).groupindex:
+            raise ValueError(
+                f"The pattern of {type(self).__name__} must define a named group {name!r}"
+            )
         self.name = name
 
     def __str__(self) -> str:
@@ -28,44 +42,32 @@ class MatcherAction(ABC):
         return hash(str(self))
 
 
-class MultiProblems:
-    def __init__(self, problems: Set[str | MatcherAction]):
-        self.problems = problems
-
-    def __str__(self):
-        return str(sorted([self.problems]))
-
-    def __repr__(self) -> str:
-        return self.__str__()
-
-    def __hash__(self) -> int:
-        return hash(str(self))
-
-    def __eq__(self, multi_problem: object) -> bool:
-        if not isinstance(multi_problem, MultiProblems):
-            raise NotImplementedError
-        return self.__hash__() == multi_problem.__hash__()
+MatchMapping = Dict[str | MatcherAction, str | Type[MatcherAction]]
 
 
-MatchMapping = Dict[str | MatcherAction, str | Type[MatcherAction]]
+class ForbiddenCharacters(NamedTuple):
+    mapping: MatchMapping
+    string_keys: frozenset[str]
+    matcher_pattern: re.Pattern | None
+    matchers_by_group: Dict[str, MatcherAction]
+    matcher_suffixes: tuple[str, ...] | None
+    translate_table: Dict[int, str]
 
 
 CYCLE_CHAR = "."
 CYCLE_MAX_STAGE = 20
 CYCLE_STAGE = 0
 CYCLE_MODE = True
-CYCLE_LAST_UPDATE = time.time()
 CYCLE_UPDATE_RATE = 1 / 60  # 60 Hz
 CYCLE_PREFIX = "Scanning : "
+CYCLE_STAGES = tuple(
+    f"{CYCLE_PREFIX}{CYCLE_CHAR * stage}{' ' * (CYCLE_MAX_STAGE - stage)}"
+    for stage in range(CYCLE_MAX_STAGE + 1)
+)
 
 
-def cycle():
-    global CYCLE_STAGE, CYCLE_MODE, CYCLE_LAST_UPDATE
-    current_time = time.time()
-    if current_time - CYCLE_LAST_UPDATE < CYCLE_UPDATE_RATE:
-        return
-    CYCLE_LAST_UPDATE = current_time
-
+def cycle_draw(count: int | None = None):
+    global CYCLE_STAGE, CYCLE_MODE
     if CYCLE_MODE:
         CYCLE_STAGE += 1
         if CYCLE_STAGE > CYCLE_MAX_STAGE:
@@ -77,98 +79,133 @@ def cycle():
             CYCLE_STAGE = 0
             CYCLE_MODE = not CYCLE_MODE
 
-    print(
-        f"{CYCLE_PREFIX}{CYCLE_CHAR * CYCLE_STAGE}{' ' * (CYCLE_MAX_STAGE - CYCLE_STAGE)}",
-        end="\r",
-    )
+    line = CYCLE_STAGES[CYCLE_STAGE]
+    if count is not None:
+        line = f"{line} {count}"
+    sys.stdout.write(line + "\r")
+    sys.stdout.flush()
 
 
 def cycle_end():
-    print((" " * len(CYCLE_PREFIX)) + " " * (CYCLE_MAX_STAGE + 1))
+    print((" " * len(CYCLE_PREFIX)) + " " * (CYCLE_MAX_STAGE + 21))
+
+
+class ScanProgress:
+    def __init__(self):
+        self.count = 0
 
+    def increment(self):
+        self.count += 1
 
-@dataclass
+
+@dataclass(slots=True)
 class FileSystemItem:
     type: Literal["file", "directory"]
     invalid: bool
-    path: Path
-    problems: Set[str | MatcherAction]
+    root: str
+    name: str
+    problems: frozenset[str | MatcherAction]
+    _key: tuple = field(init=False, repr=False)
+
+    def __post_init__(self):
+        key = _KEY_CACHE.get(self.problems)
+        if key is None:
+            key = tuple(sorted(map(str, self.problems)))
+            _KEY_CACHE[self.problems] = key
+        self._key = key
+
+    @property
+    def path(self) -> Path:
+        return Path(self.root) / self.name
 
 
-@dataclass
 class FileSystemData:
-    scanned_items: list[FileSystemItem] = field(default_factory=list)
+    def __init__(self):
+        self._file_count = 0
+        self._directories_count = 0
+        self._problematic_files_count = 0
+        self._problematic_directories_count = 0
+        self._problematic_files_types: Dict[tuple, list[FileSystemItem]] = defaultdict(
+            list
+        )
+        self._problematic_directories_types: Dict[tuple, list[FileSystemItem]] = (
+            defaultdict(list)
+        )
 
     def add(
         self,
         type: Literal["file", "directory"],
         invalid: bool,
-        path: Path,
-        problems: Set[str | MatcherAction],
+        root: str,
+        name: str,
+        problems: frozenset[str | MatcherAction],
     ):
-        self.scanned_items.append(
-            FileSystemItem(type=type, invalid=invalid, path=path, problems=problems)
+        if type == "directory":
+            self._directories_count += 1
+        else:
+            self._file_count += 1
+        if not invalid:
+            return
+        item = FileSystemItem(
+            type=type, invalid=invalid, root=root, name=name, problems=problems
         )
-
-    @property
-    def directories(self):
-        return [item for item in self.scanned_items if item.type == "directory"]
-
-    @property
-    def files(self):
-        return [item for item in self.scanned_items if item.type == "file"]
+        if type == "directory":
+            self._problematic_directories_count += 1
+            self._problematic_directories_types[item._key].append(item)
+        else:
+            self._problematic_files_count += 1
+            self._problematic_files_types[item._key].append(item)
 
     @property
     def directories_count(self):
-        return len(self.directories)
+        return self._directories_count
 
     @property
     def file_count(self):
-        return len(self.files)
+        return self._file_count
 
     @property
     def problematic_files(self):
-        return [item for item in self.files if item.invalid]
+        return [
+            item
+            for items in self._problematic_files_types.values()
+            for item in items
+        ]
 
     @property
     def problematic_directories(self):
-        return [item for item in self.directories if item.invalid]
+        return [
+            item
+            for items in self._problematic_directories_types.values()
+            for item in items
+        ]
 
     @property
     def problematic_files_count(self):
-        return len(self.problematic_files)
+        return self._problematic_files_count
 
     @property
     def problematic_directories_count(self):
-        return len(self.problematic_directories)
+        return self._problematic_directories_count
 
     @property
     def problematic_files_types(self):
-        unique_problems = set(
-            [MultiProblems(item.problems) for item in self.problematic_files]
-        )
-        return {
-            problem_key: [
-                item
-                for item in self.problematic_files
-                if MultiProblems(item.problems) == problem_key
-            ]
-            for problem_key in unique_problems
-        }
+        return self._problematic_files_types
 
     @property
     def problematic_directories_types(self):
-        unique_problems = set(
-            [MultiProblems(item.problems) for item in self.problematic_directories]
-        )
-        return {
-            problem_key: [
-                item
-                for item in self.problematic_directories
-                if MultiProblems(item.problems) == problem_key
-            ]
-            for problem_key in unique_problems
-        }
+        return self._problematic_directories_types
+
+    def merge(self, other: "FileSystemData"):
+        self._file_count += other._file_count
+        self._directories_count += other._directories_count
+        self._problematic_files_count += other._problematic_files_count
+        self._problematic_directories_count += other._problematic_directories_count
+        for key, items in other._problematic_files_types.items():
+            self._problematic_files_types[key].extend(items)
+        for key, items in other._problematic_directories_types.items():
+            self._problematic_directories_types[key].extend(items)
+        return self
 
     @property
     def problematic_directories_types_counts(self):
@@ -185,49 +222,138 @@ class FileSystemData:
         }
 
 
+def walk_scandir(root: str):
+    pending = deque([root])
+    while pending:
+        current_folder = pending.popleft()
+        try:
+            entries = os.scandir(current_folder)
+        except OSError:
+            continue
+        directories: list[str] = []
+        files: list[str] = []
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.name)
+                    pending.append(entry.path)
+                else:
+                    files.append(entry.name)
+        yield current_folder, directories, files
+
+
 def parse_item(
-    root: Path,
+    root: str,
     item_name: str,
     item_type: Literal["file", "directory"],
     data: FileSystemData,
-    forbidden_characters_mapping: MatchMapping,
+    forbidden_characters: ForbiddenCharacters,
 ):
-    invalidity, problems = is_item_invalid(item_name, forbidden_characters_mapping)
+    invalidity, problems = is_item_invalid(item_name, forbidden_characters)
     data.add(
         type=item_type,
         invalid=invalidity,
-        path=root / item_name,
+        root=root,
+        name=item_name,
         problems=problems,
     )
 
 
+def scan_subtree(
+    root: str,
+    forbidden_characters: ForbiddenCharacters,
+    progress: ScanProgress | None = None,
+) -> FileSystemData:
+    data = FileSystemData()
+    check = is_item_invalid
+    add = data.add
+    string_keys = forbidden_characters.string_keys
+    increment = progress.increment if progress is not None else None
+    for current_folder, directories, files in walk_scandir(root):
+        for item_type, names in (("directory", directories), ("file", files)):
+            if not names:
+                continue
+            # one C-level scan over the whole batch; isdisjoint stops at
+            # the first forbidden character and never builds a result set
+            check_strings = not string_keys.isdisjoint("\x00".join(names))
+            for item_name in names:
+                invalidity, problems = check(
+                    item_name, forbidden_characters, check_strings
+                )
+                add(
+                    type=item_type,
+                    invalid=invalidity,
+                    root=current_folder,
+                    name=item_name,
+                    problems=problems,
+                )
+                if increment is not None:
+                    increment()
+    return data
+
+
+_PROBLEM_INTERN: Dict[frozenset, frozenset] = {}
+_NO_PROBLEMS: frozenset = frozenset()
+_KEY_CACHE: Dict[frozenset, tuple] = {}
+
+
 def is_item_invalid(
     item_name: str,
-    forbidden_characters_mapping: MatchMapping,
-) -> tuple[bool, Set[str | MatcherAction]]:
-    problems = set(
-        [
-            char
-            for char in forbidden_characters_mapping.keys()
-            if (isinstance(char, str) and char in item_name)
-            or isinstance(char, MatcherAction)
-            and char.matches(item_name)
-        ]
+    forbidden_characters: ForbiddenCharacters,
+    check_strings: bool = True,
+) -> tuple[bool, frozenset[str | MatcherAction]]:
+    problems: Set[str | MatcherAction] = (
+        set(forbidden_characters.string_keys.intersection(item_name))
+        if check_strings
+        else set()
     )
-
-    # problems = set(
-    #     [char for char in forbidden_characters_mapping.keys() if char in item_name]
-    # )
-    # if item_name.endswith((",", " ")):
-    #     problems.add("termination")
-    if len(problems):
-        return True, problems
-    return False, set()
+    if forbidden_characters.matcher_pattern is not None and (
+        forbidden_characters.matcher_suffixes is None
+        or item_name.endswith(forbidden_characters.matcher_suffixes)
+    ):
+        for match in forbidden_characters.matcher_pattern.finditer(item_name):
+            if match.lastgroup is not None:
+                problems.add(forbidden_characters.matchers_by_group[match.lastgroup])
+
+    if not problems:
+        return False, _NO_PROBLEMS
+    key = frozenset(problems)
+    return True, _PROBLEM_INTERN.setdefault(key, key)
+
+
+_SCANNED_FILES_TPL = (
+    f"{Fore.BLUE}Scanned {Fore.YELLOW}{{count}}{Fore.BLUE} total files.{Style.RESET_ALL}"
+)
+_SCANNED_DIRECTORIES_TPL = (
+    f"{Fore.BLUE}Scanned {Fore.YELLOW}{{count}}{Fore.BLUE} total repositories.{Style.RESET_ALL}"
+)
+_PROBLEMATIC_FILES_TPL = (
+    f"{Fore.BLUE}Found {Fore.YELLOW}{{count}}{Fore.BLUE} problematic files.{Style.RESET_ALL}"
+)
+_PROBLEMATIC_DIRECTORIES_TPL = (
+    f"{Fore.BLUE}Found {Fore.YELLOW}{{count}}{Fore.BLUE} "
+    f"problematic repositories.{Style.RESET_ALL}"
+)
+_RENAME_PROMPT_TPL = (
+    f" - {Fore.BLUE}{{kind}} : {Fore.YELLOW}{{old}}{Fore.BLUE} "
+    "will be renamed into "
+    f"{Fore.YELLOW}{{new}}{Fore.BLUE}. "
+    f"{Fore.LIGHTMAGENTA_EX}Do you agree to proceed ?{Fore.RESET}"
+)
 
 
 @click.command()
-@click.option("-p", "--path", default=Path.home(), help="Path")
-def run(path: str):
+@click.option(
+    "-p", "--path", default=lambda: str(Path.home()), show_default=False, help="Path"
+)
+@click.option(
+    "-b",
+    "--batch-size",
+    default=20,
+    show_default=True,
+    help="Number of renames proposed per prompt. 1 asks for each item separately.",
+)
+def run(path: str, batch_size: int):
     root = Path(path)
 
     click.echo(
@@ -239,45 +365,57 @@ def run(path: str):
     if not status:
         return
 
-    forbidden_characters_mapping = get_forbidden_characters()
+    forbidden_characters = get_forbidden_characters()
     data = FileSystemData()
-    for current_folder, dirs, files in root.walk():
-        for directory in dirs:
-            parse_item(
-                current_folder,
-                directory,
-                "directory",
-                data,
-                forbidden_characters_mapping,
-            )
-
-        for file in files:
-            parse_item(
-                current_folder,
-                file,
-                "file",
-                data,
-                forbidden_characters_mapping,
-            )
-
-        cycle()
+    progress = ScanProgress()
+    scan_done = threading.Event()
+
+    def spin():
+        while not scan_done.is_set():
+            cycle_draw(progress.count)
+            scan_done.wait(CYCLE_UPDATE_RATE)
+
+    subtrees = []
+    try:
+        top_entries = list(os.scandir(str(root)))
+    except OSError:
+        top_entries = []
+    for entry in top_entries:
+        is_dir = entry.is_dir(follow_symlinks=False)
+        parse_item(
+            str(root),
+            entry.name,
+            "directory" if is_dir else "file",
+            data,
+            forbidden_characters,
+        )
+        progress.increment()
+        if is_dir:
+            subtrees.append(entry.path)
+
+    spinner = threading.Thread(target=spin, daemon=True)
+    spinner.start()
+    with ThreadPoolExecutor(
+        max_workers=min(32, (os.cpu_count() or 1) * 4)
+    ) as executor:
+        futures = [
+            executor.submit(scan_subtree, subtree, forbidden_characters, progress)
+            for subtree in subtrees
+        ]
+        for future in futures:
+            data.merge(future.result())
+    scan_done.set()
+    spinner.join()
     cycle_end()
 
+    click.echo(_SCANNED_FILES_TPL.format(count=data.file_count))
+    click.echo(_SCANNED_DIRECTORIES_TPL.format(count=data.directories_count))
+    click.echo(_PROBLEMATIC_FILES_TPL.format(count=data.problematic_files_count))
     click.echo(
-        f"{Fore.BLUE}Scanned {Fore.YELLOW}{data.file_count}{Fore.BLUE} total files.{Style.RESET_ALL}"
-    )
-    click.echo(
-        f"{Fore.BLUE}Scanned {Fore.YELLOW}{data.directories_count}{Fore.BLUE} total repositories.{Style.RESET_ALL}"
-    )
-    click.echo(
-        f"{Fore.BLUE}Found {Fore.YELLOW}{data.problematic_files_count}{Fore.BLUE} problematic files.{Style.RESET_ALL}"
-    )
-    click.echo(
-        f"{Fore.BLUE}Found {Fore.YELLOW}{data.problematic_directories_count}{Fore.BLUE} "
-        f"problematic repositories.{Style.RESET_ALL}"
+        _PROBLEMATIC_DIRECTORIES_TPL.format(count=data.problematic_directories_count)
     )
 
-    def format_mapping_results(mapping: dict[MultiProblems, int]):
+    def format_mapping_results(mapping: dict[tuple, int]):
         return "\n".join(
             [
                 f" - {Fore.GREEN}{key}{Fore.BLUE} contains {Fore.CYAN}{value}{Fore.RESET}"
@@ -301,57 +439,115 @@ def run(path: str):
     ]:
         for problem_name, items in problem_dictionnary.items():
             click.echo(f"{Fore.BLUE}Problem {Fore.GREEN}{problem_name}{Fore.RESET}")
+            if batch_size > 1:
+                prompt_batch(items, forbidden_characters, size=batch_size)
+                continue
             for item in items:
-                renamed_path = get_item_renamed_path(item, forbidden_characters_mapping)
+                renamed_path = get_item_renamed_path(item, forbidden_characters)
                 agreed = click.confirm(
-                    f" - {Fore.BLUE}{item.type.capitalize()} : {Fore.YELLOW}{item.path}{Fore.BLUE} "
-                    "will be renamed into "
-                    f"{Fore.YELLOW}{renamed_path}{Fore.BLUE}. "
-                    f"{Fore.LIGHTMAGENTA_EX}Do you agree to proceed ?{Fore.RESET}",
+                    _RENAME_PROMPT_TPL.format(
+                        kind=item.type.capitalize(),
+                        old=item.path,
+                        new=renamed_path,
+                    ),
                     prompt_suffix="",
                     default=True,
                     show_default=False,
                 )
 
                 if agreed:
-                    item.path.rename(renamed_path)
-                    click.echo(
-                        f"{Fore.GREEN}✅ Renamed {Fore.YELLOW}{renamed_path}{Fore.GREEN} succesfully.{Fore.RESET}"
-                    )
+                    rename_item(item, renamed_path)
                 else:
                     click.echo(f"{Fore.RED}🚫 Did not rename. {Fore.RESET}")
 
 
+def rename_item(item: FileSystemItem, renamed_path: Path):
+    item.path.rename(renamed_path)
+    click.echo(
+        f"{Fore.GREEN}✅ Renamed {Fore.YELLOW}{renamed_path}{Fore.GREEN} succesfully.{Fore.RESET}"
+    )
+
+
+def prompt_batch(
+    items: list[FileSystemItem],
+    forbidden_characters: ForbiddenCharacters,
+    size: int = 20,
+):
+    for start in range(0, len(items), size):
+        page = items[start : start + size]
+        renames = [
+            (item, get_item_renamed_path(item, forbidden_characters)) for item in page
+        ]
+        for index, (item, renamed_path) in enumerate(renames, start=1):
+            click.echo(
+                f" {index:>3}. {Fore.BLUE}{item.type.capitalize()} : {Fore.YELLOW}{item.path}{Fore.BLUE} "
+                f"will be renamed into {Fore.YELLOW}{renamed_path}{Fore.RESET}"
+            )
+        while True:
+            answer = click.prompt(
+                f"{Fore.LIGHTMAGENTA_EX}Indices to skip (comma separated), "
+                f"'a' to rename all, 'n' to skip all{Fore.RESET}",
+                default="a",
+                show_default=False,
+            )
+            answer = answer.strip().lower()
+            if answer in ("", "a", "all"):
+                skipped = set()
+                break
+            if answer in ("n", "none"):
+                skipped = set(range(1, len(page) + 1))
+                break
+            try:
+                skipped = {int(token) for token in answer.split(",") if token.strip()}
+            except ValueError:
+                click.echo(
+                    f"{Fore.RED}Invalid input, expected comma separated indices, "
+                    f"'a' or 'n'. Please try again.{Fore.RESET}"
+                )
+                continue
+            out_of_range = {
+                index for index in skipped if not 1 <= index <= len(page)
+            }
+            if out_of_range:
+                click.echo(
+                    f"{Fore.RED}Invalid input, indices {sorted(out_of_range)} are out of "
+                    f"range 1-{len(page)}. Please try again.{Fore.RESET}"
+                )
+                continue
+            break
+
+        for index, (item, renamed_path) in enumerate(renames, start=1):
+            if index in skipped:
+                click.echo(
+                    f"{Fore.RED}🚫 Did not rename {Fore.YELLOW}{item.path}{Fore.RED}. {Fore.RESET}"
+                )
+                continue
+            rename_item(item, renamed_path)
+
+
 def get_item_renamed_path(
-    item: FileSystemItem, forbidden_characters_mapping: MatchMapping
+    item: FileSystemItem, forbidden_characters: ForbiddenCharacters
 ):
     if not item.invalid:
         return item.path
-    new_path = item.path
+    new_name = item.name.translate(forbidden_characters.translate_table)
     for problem in item.problems:
-        if isinstance(problem, str) and isinstance(
-            replacement := forbidden_characters_mapping[problem], str
-        ):
-            new_path = new_path.parent / str(new_path.name).replace(
-                problem, replacement
-            )
+        if isinstance(problem, MatcherAction):
+            new_name = problem.replace(new_name)
 
-        elif isinstance(problem, MatcherAction):
-            new_path = new_path.parent / problem.replace(new_path.name)
-
-        else:
+        elif not isinstance(problem, str):
             click.echo(
                 f"{Fore.RED}The problem {Fore.YELLOW}{problem}{Fore.RED} was not possible to treat.{Fore.RESET}"
             )
-    return new_path
+    return Path(item.root) / new_name
 
 
 def get_forbidden_characters():
     forbidden_mapping: MatchMapping
 
     class Termination(MatcherAction):
-        def matches(self, item_name: str):
-            return item_name.endswith((",", " ", ".", "\uf022"))
+        pattern = r"(?P<termination>[ ,.\uf022]+$)"
+        suffixes = (",", " ", ".", "\uf022")
 
         @classmethod
         def replace(cls, item_name: str):
@@ -378,14 +574,19 @@ def get_forbidden_characters():
         Termination("termination"): Termination,
     }
 
+    menu_cache = None
+
     def format_characters():
-        return "\n".join(
-            [
-                f" - {Fore.GREEN}{repr(key).replace("'", '')}{Fore.BLUE} will be converted to "
-                f"{Fore.CYAN}{value}{Fore.RESET}"
-                for key, value in forbidden_mapping.items()
-            ]
-        )
+        nonlocal menu_cache
+        if menu_cache is None:
+            menu_cache = "\n".join(
+                [
+                    f" - {Fore.GREEN}{repr(key).replace("'", '')}{Fore.BLUE} will be converted to "
+                    f"{Fore.CYAN}{value}{Fore.RESET}"
+                    for key, value in forbidden_mapping.items()
+                ]
+            )
+        return menu_cache
 
     def char_validation(char):
         if any([c in char for c in forbidden_mapping.keys() if isinstance(c, str)]):
@@ -418,5 +619,39 @@ def get_forbidden_characters():
                 )
 
         forbidden_mapping[edit_source_char] = edit_destination_char
+        menu_cache = None
 
-    return forbidden_mapping
+    string_keys = frozenset(
+        char for char in forbidden_mapping.keys() if isinstance(char, str)
+    )
+    matchers = tuple(
+        char for char in forbidden_mapping.keys() if isinstance(char, MatcherAction)
+    )
+    matchers_by_group = {matcher.name: matcher for matcher in matchers}
+    matcher_pattern = (
+        re.compile("|".join(matcher.pattern for matcher in matchers))
+        if matchers
+        else None
+    )
+    matcher_suffixes: tuple[str, ...] | None = tuple(
+        suffix for matcher in matchers for suffix in matcher.suffixes
+    )
+    if any(not matcher.suffixes for matcher in matchers):
+        # a matcher without declared suffixes can hit anywhere in the
+        # name, so the endswith pre-filter cannot be used
+        matcher_suffixes = None
+    translate_table = str.maketrans(
+        {
+            char: replacement
+            for char, replacement in forbidden_mapping.items()
+            if isinstance(char, str) and isinstance(replacement, str)
+        }
+    )
+    return ForbiddenCharacters(
+        mapping=forbidden_mapping,
+        string_keys=string_keys,
+        matcher_pattern=matcher_pattern,
+        matchers_by_group=matchers_by_group,
+        matcher_suffixes=matcher_suffixes,
+        translate_table=translate_table,
+    )